@@ -8,64 +8,78 @@ void SerialComms::begin() {
 }
 
 void SerialComms::poll() {
+    // One timestamp per poll — draining the RX buffer takes well under a millisecond
+    unsigned long now = millis();
+
     // Reset state machine if timeout waiting for frame completion (prevents state machine from getting stuck)
-    if (_state != WAIT_START && (millis() - _lastByteTime) > FRAME_TIMEOUT_MS) {
+    if (_state != WAIT_START && (now - _lastByteTime) > FRAME_TIMEOUT_MS) {
         _state = WAIT_START;
     }
 
     // Detect bridge disconnect: connected but no message received within timeout
-    if (_bridgeConnected && _lastMsgTime != 0 && (millis() - _lastMsgTime) > BRIDGE_TIMEOUT_MS) {
+    if (_bridgeConnected && _lastMsgTime != 0 && (now - _lastMsgTime) > BRIDGE_TIMEOUT_MS) {
         _bridgeConnected = false;
         _lastMsgTime = 0;
         if (_onBridgeDisconnected) _onBridgeDisconnected();
     }
 
-    while (Serial.available()) {
-        uint8_t byte = Serial.read();
-        _lastByteTime = millis();  // Track when we received data
+    // Drain the RX FIFO in chunks rather than one read() call per byte
+    uint8_t rx[64];
+    int avail;
+    while ((avail = Serial.available()) > 0) {
+        size_t n = Serial.read(rx, avail < (int)sizeof(rx) ? (size_t)avail : sizeof(rx));
+        if (n == 0) break;
+        _lastByteTime = now;  // Track when we received data
 
-        switch (_state) {
-        case WAIT_START:
-            if (byte == FRAME_START_BYTE) {
-                _state = READ_LEN_HI;
-            }
-            break;
-
-        case READ_LEN_HI:
-            _bodyLen = (uint16_t)byte << 8;
-            _state = READ_LEN_LO;
-            break;
-
-        case READ_LEN_LO:
-            _bodyLen |= byte;
-            if (_bodyLen == 0 || _bodyLen > MAX_MSG_LEN) {
-                _state = WAIT_START;  // Invalid length
-            } else {
-                _bodyIdx = 0;
-                _state = READ_BODY;
-            }
-            break;
+        for (size_t i = 0; i < n; i++) {
+            parseByte(rx[i]);
+        }
+    }
+}
 
-        case READ_BODY:
-            _buffer[_bodyIdx++] = byte;
-            if (_bodyIdx >= _bodyLen) {
-                _state = READ_CHECKSUM;
-            }
-            break;
+void SerialComms::parseByte(uint8_t byte) {
+    switch (_state) {
+    case WAIT_START:
+        if (byte == FRAME_START_BYTE) {
+            _state = READ_LEN_HI;
+        }
+        break;
 
-        case READ_CHECKSUM: {
-            uint8_t expected = protocol::checksum(_buffer, _bodyLen);
-            if (byte == expected) {
-                processMessage(_buffer[0], _buffer + 1, _bodyLen - 1);
-            }
-            _state = WAIT_START;
-            break;
+    case READ_LEN_HI:
+        _bodyLen = (uint16_t)byte << 8;
+        _state = READ_LEN_LO;
+        break;
+
+    case READ_LEN_LO:
+        _bodyLen |= byte;
+        if (_bodyLen == 0 || _bodyLen > MAX_MSG_LEN) {
+            _state = WAIT_START;  // Invalid length
+        } else {
+            _bodyIdx = 0;
+            _bodyChecksum = 0;
+            _state = READ_BODY;
         }
+        break;
+
+    case READ_BODY:
+        _buffer[_bodyIdx++] = byte;
+        _bodyChecksum ^= byte;  // Accumulate as bytes arrive — no second pass over the body
+        if (_bodyIdx >= _bodyLen) {
+            _state = READ_CHECKSUM;
         }
+        break;
+
+    case READ_CHECKSUM:
+        if (byte == _bodyChecksum) {
+            _buffer[_bodyLen] = '\0';  // Lets text payloads be used in place
+            processMessage(_buffer[0], _buffer + 1, _bodyLen - 1);
+        }
+        _state = WAIT_START;
+        break;
     }
 }
 
-void SerialComms::processMessage(uint8_t msgType, const uint8_t* payload, uint16_t len) {
+void SerialComms::processMessage(uint8_t msgType, uint8_t* payload, uint16_t len) {
     _bridgeConnected = true;
     _lastMsgTime = millis();
     switch (msgType) {
@@ -98,19 +112,22 @@ void SerialComms::processMessage(uint8_t msgType, const uint8_t* payload, uint16
 
     case MSG_SET_LABELS: {
         if (_onSetLabels && len > 0) {
+            // Payload is [len, label...] pairs. Each label is shifted down over
+            // its own length byte and NUL-terminated in the receive buffer, so
+            // no separate label buffers are needed.
             const char* labels[4] = {"", "", "", ""};
-            static char labelBufs[4][32];
             int labelIdx = 0;
             uint16_t pos = 0;
 
             while (pos < len && labelIdx < 4) {
-                uint8_t labelLen = payload[pos++];
-                if (pos + labelLen > len) break;
-                uint8_t copyLen = labelLen < 31 ? labelLen : 31;
-                memcpy(labelBufs[labelIdx], payload + pos, copyLen);
-                labelBufs[labelIdx][copyLen] = '\0';
-                labels[labelIdx] = labelBufs[labelIdx];
-                pos += labelLen;
+                uint8_t labelLen = payload[pos];
+                if (pos + 1 + labelLen > len) break;
+                uint8_t keepLen = labelLen < 31 ? labelLen : 31;
+                char* label = (char*)payload + pos;
+                memmove(label, label + 1, keepLen);
+                label[keepLen] = '\0';
+                labels[labelIdx] = label;
+                pos += 1 + labelLen;
                 labelIdx++;
             }
             _onSetLabels(labels);
@@ -120,17 +137,16 @@ void SerialComms::processMessage(uint8_t msgType, const uint8_t* payload, uint16
     }
 }
 
-void SerialComms::sendFrame(uint8_t msgType, const uint8_t* payload, uint16_t len) {
-    uint8_t frame[MAX_MSG_LEN + 5];
-    uint16_t frameLen = protocol::buildFrame(frame, msgType, payload, len);
-    Serial.write(frame, frameLen);
+bool SerialComms::sendFrame(uint8_t msgType, const uint8_t* payload, uint16_t len) {
+    uint16_t frameLen = protocol::buildFrame(_txBuf, msgType, payload, len);
+    return Serial.write(_txBuf, frameLen) == frameLen;
 }
 
-void SerialComms::sendButtonEvent(uint8_t buttonId, bool pressed) {
+bool SerialComms::sendButtonEvent(uint8_t buttonId, bool pressed) {
     uint8_t payload[2] = {buttonId, (uint8_t)(pressed ? 1 : 0)};
-    sendFrame(MSG_BUTTON, payload, 2);
+    return sendFrame(MSG_BUTTON, payload, 2);
 }
 
-void SerialComms::sendHeartbeat(uint8_t status) {
-    sendFrame(MSG_HEARTBEAT, &status, 1);
+bool SerialComms::sendHeartbeat(uint8_t status) {
+    return sendFrame(MSG_HEARTBEAT, &status, 1);
 }
@@ -5,6 +5,7 @@
 
 class SerialComms {
 public:
+    // text is NUL-terminated in the receive buffer; valid only during the callback
     using TextCallback   = void (*)(const char* text, uint16_t len);
     using LedsCallback   = void (*)(const uint8_t* data, uint16_t len);
     using LabelsCallback = void (*)(const char* labels[4]);
@@ -13,8 +14,9 @@ public:
     void begin();
     void poll();
 
-    void sendButtonEvent(uint8_t buttonId, bool pressed);
-    void sendHeartbeat(uint8_t status);
+    // Return false if the frame could not be fully queued for USB
+    bool sendButtonEvent(uint8_t buttonId, bool pressed);
+    bool sendHeartbeat(uint8_t status);
 
     bool bridgeConnected() const { return _bridgeConnected; }
 
@@ -26,8 +28,9 @@ public:
     void onBridgeDisconnected(VoidCallback cb){ _onBridgeDisconnected = cb; }
 
 private:
-    void processMessage(uint8_t msgType, const uint8_t* payload, uint16_t len);
-    void sendFrame(uint8_t msgType, const uint8_t* payload, uint16_t len);
+    void parseByte(uint8_t byte);
+    void processMessage(uint8_t msgType, uint8_t* payload, uint16_t len);
+    bool sendFrame(uint8_t msgType, const uint8_t* payload, uint16_t len);
 
     enum ParseState {
         WAIT_START,
@@ -38,13 +41,15 @@ private:
     };
 
     ParseState _state = WAIT_START;
-    uint8_t    _buffer[MAX_MSG_LEN];
+    uint8_t    _buffer[MAX_MSG_LEN + 1];  // +1 for in-place NUL terminator
+    uint8_t    _txBuf[MAX_MSG_LEN + 5];   // Outgoing frame (start + len + body + checksum)
     uint16_t   _bodyLen = 0;
     uint16_t   _bodyIdx = 0;
+    uint8_t    _bodyChecksum = 0;  // Running XOR of body bytes received so far
     unsigned long _lastByteTime = 0;  // Timeout tracking for frame parser
     unsigned long _lastMsgTime  = 0;  // Time of last complete message received
-    static const unsigned long FRAME_TIMEOUT_MS  = 500;   // Reset parser if no complete frame in 500ms
-    static const unsigned long BRIDGE_TIMEOUT_MS = 15000; // Declare disconnected after 15s silence
+    static constexpr unsigned long FRAME_TIMEOUT_MS  = 500;   // Reset parser if no complete frame in 500ms
+    static constexpr unsigned long BRIDGE_TIMEOUT_MS = 15000; // Declare disconnected after 15s silence
 
     bool           _bridgeConnected = false;
     TextCallback   _onDisplayText        = nullptr;
@@ -2,6 +2,12 @@
 
 #include <cstdint>
 
+// ----- Debug -----
+// DBG() prints in main.cpp compile to nothing unless built with -DCAMELPAD_DEBUG=1
+#ifndef CAMELPAD_DEBUG
+#define CAMELPAD_DEBUG 0
+#endif
+
 // ----- I2C (Seesaw) -----
 #define PIN_I2C_SDA 15
 #define PIN_I2C_SCL 7
@@ -12,6 +18,7 @@
 #define SEESAW_BTN_2 2
 #define SEESAW_BTN_3 3
 #define SEESAW_BTN_4 4
+#define SEESAW_BUTTON_COUNT 4  // Must match SeesawManager::BUTTON_PINS (checked, max 8)
 #define SEESAW_NEOPIX_PIN 0
 #define SEESAW_NEOPIXEL_COUNT 4
 
@@ -87,3 +94,6 @@
 #define FRAME_START_BYTE 0xAA
 #define MAX_MSG_LEN 512
 #define SERIAL_BAUD 115200
+
+// ----- Main Loop -----
+#define LOOP_PERIOD_MS 10  // Fixed poll cadence for comms + buttons
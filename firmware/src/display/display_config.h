@@ -5,51 +5,53 @@
 
 // Waveshare ESP32-S3-LCD-3.16 ST7701 init sequence
 // Extracted from the manufacturer's example (lvgl_port.c lines 32-81)
+// Parameter bytes are const so they live in flash (.rodata) instead of being
+// copied into DRAM at boot.
 static const st7701_lcd_init_cmd_t lcd_init_cmds[] = {
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x13}, 5, 0},
-  {0xEF, (uint8_t []){0x08}, 1, 0},
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x10}, 5, 0},
-  {0xC0, (uint8_t []){0xE5,0x02}, 2, 0},
-  {0xC1, (uint8_t []){0x15,0x0A}, 2, 0},
-  {0xC2, (uint8_t []){0x07,0x02}, 2, 0},
-  {0xCC, (uint8_t []){0x10}, 1, 0},
-  {0xB0, (uint8_t []){0x00,0x08,0x51,0x0D,0xCE,0x06,0x00,0x08,0x08,0x24,0x05,0xD0,0x0F,0x6F,0x36,0x1F}, 16, 0},
-  {0xB1, (uint8_t []){0x00,0x10,0x4F,0x0C,0x11,0x05,0x00,0x07,0x07,0x18,0x02,0xD3,0x11,0x6E,0x34,0x1F}, 16, 0},
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x11}, 5, 0},
-  {0xB0, (uint8_t []){0x4D}, 1, 0},
-  {0xB1, (uint8_t []){0x37}, 1, 0},
-  {0xB2, (uint8_t []){0x87}, 1, 0},
-  {0xB3, (uint8_t []){0x80}, 1, 0},
-  {0xB5, (uint8_t []){0x4A}, 1, 0},
-  {0xB7, (uint8_t []){0x85}, 1, 0},
-  {0xB8, (uint8_t []){0x21}, 1, 0},
-  {0xB9, (uint8_t []){0x00,0x13}, 2, 0},
-  {0xC0, (uint8_t []){0x09}, 1, 0},
-  {0xC1, (uint8_t []){0x78}, 1, 0},
-  {0xC2, (uint8_t []){0x78}, 1, 0},
-  {0xD0, (uint8_t []){0x88}, 1, 0},
-  {0xE0, (uint8_t []){0x80,0x00,0x02}, 3, 100},
-  {0xE1, (uint8_t []){0x0F,0xA0,0x00,0x00,0x10,0xA0,0x00,0x00,0x00,0x60,0x60}, 11, 0},
-  {0xE2, (uint8_t []){0x30,0x30,0x60,0x60,0x45,0xA0,0x00,0x00,0x46,0xA0,0x00,0x00,0x00}, 13, 0},
-  {0xE3, (uint8_t []){0x00,0x00,0x33,0x33}, 4, 0},
-  {0xE4, (uint8_t []){0x44,0x44}, 2, 0},
-  {0xE5, (uint8_t []){0x0F,0x4A,0xA0,0xA0,0x11,0x4A,0xA0,0xA0,0x13,0x4A,0xA0,0xA0,0x15,0x4A,0xA0,0xA0}, 16, 0},
-  {0xE6, (uint8_t []){0x00,0x00,0x33,0x33}, 4, 0},
-  {0xE7, (uint8_t []){0x44,0x44}, 2, 0},
-  {0xE8, (uint8_t []){0x10,0x4A,0xA0,0xA0,0x12,0x4A,0xA0,0xA0,0x14,0x4A,0xA0,0xA0,0x16,0x4A,0xA0,0xA0}, 16, 0},
-  {0xEB, (uint8_t []){0x02,0x00,0x4E,0x4E,0xEE,0x44,0x00}, 7, 0},
-  {0xED, (uint8_t []){0xFF,0xFF,0x04,0x56,0x72,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0x27,0x65,0x40,0xFF,0xFF}, 16, 0},
-  {0xEF, (uint8_t []){0x08,0x08,0x08,0x40,0x3F,0x64}, 6, 0},
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x13}, 5, 0},
-  {0xE8, (uint8_t []){0x00,0x0E}, 2, 0},
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x00}, 5, 0},
-  {0x11, (uint8_t []){0x00}, 0, 120},
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x13}, 5, 0},
-  {0xE8, (uint8_t []){0x00,0x0C}, 2, 10},
-  {0xE8, (uint8_t []){0x00,0x00}, 2, 0},
-  {0xFF, (uint8_t []){0x77,0x01,0x00,0x00,0x00}, 5, 0},
-  {0x3A, (uint8_t []){0x55}, 1, 0},
-  {0x36, (uint8_t []){0x00}, 1, 0},
-  {0x35, (uint8_t []){0x00}, 1, 0},
-  {0x29, (uint8_t []){0x00}, 0, 20},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x13}, 5, 0},
+  {0xEF, (const uint8_t []){0x08}, 1, 0},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x10}, 5, 0},
+  {0xC0, (const uint8_t []){0xE5,0x02}, 2, 0},
+  {0xC1, (const uint8_t []){0x15,0x0A}, 2, 0},
+  {0xC2, (const uint8_t []){0x07,0x02}, 2, 0},
+  {0xCC, (const uint8_t []){0x10}, 1, 0},
+  {0xB0, (const uint8_t []){0x00,0x08,0x51,0x0D,0xCE,0x06,0x00,0x08,0x08,0x24,0x05,0xD0,0x0F,0x6F,0x36,0x1F}, 16, 0},
+  {0xB1, (const uint8_t []){0x00,0x10,0x4F,0x0C,0x11,0x05,0x00,0x07,0x07,0x18,0x02,0xD3,0x11,0x6E,0x34,0x1F}, 16, 0},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x11}, 5, 0},
+  {0xB0, (const uint8_t []){0x4D}, 1, 0},
+  {0xB1, (const uint8_t []){0x37}, 1, 0},
+  {0xB2, (const uint8_t []){0x87}, 1, 0},
+  {0xB3, (const uint8_t []){0x80}, 1, 0},
+  {0xB5, (const uint8_t []){0x4A}, 1, 0},
+  {0xB7, (const uint8_t []){0x85}, 1, 0},
+  {0xB8, (const uint8_t []){0x21}, 1, 0},
+  {0xB9, (const uint8_t []){0x00,0x13}, 2, 0},
+  {0xC0, (const uint8_t []){0x09}, 1, 0},
+  {0xC1, (const uint8_t []){0x78}, 1, 0},
+  {0xC2, (const uint8_t []){0x78}, 1, 0},
+  {0xD0, (const uint8_t []){0x88}, 1, 0},
+  {0xE0, (const uint8_t []){0x80,0x00,0x02}, 3, 100},
+  {0xE1, (const uint8_t []){0x0F,0xA0,0x00,0x00,0x10,0xA0,0x00,0x00,0x00,0x60,0x60}, 11, 0},
+  {0xE2, (const uint8_t []){0x30,0x30,0x60,0x60,0x45,0xA0,0x00,0x00,0x46,0xA0,0x00,0x00,0x00}, 13, 0},
+  {0xE3, (const uint8_t []){0x00,0x00,0x33,0x33}, 4, 0},
+  {0xE4, (const uint8_t []){0x44,0x44}, 2, 0},
+  {0xE5, (const uint8_t []){0x0F,0x4A,0xA0,0xA0,0x11,0x4A,0xA0,0xA0,0x13,0x4A,0xA0,0xA0,0x15,0x4A,0xA0,0xA0}, 16, 0},
+  {0xE6, (const uint8_t []){0x00,0x00,0x33,0x33}, 4, 0},
+  {0xE7, (const uint8_t []){0x44,0x44}, 2, 0},
+  {0xE8, (const uint8_t []){0x10,0x4A,0xA0,0xA0,0x12,0x4A,0xA0,0xA0,0x14,0x4A,0xA0,0xA0,0x16,0x4A,0xA0,0xA0}, 16, 0},
+  {0xEB, (const uint8_t []){0x02,0x00,0x4E,0x4E,0xEE,0x44,0x00}, 7, 0},
+  {0xED, (const uint8_t []){0xFF,0xFF,0x04,0x56,0x72,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0x27,0x65,0x40,0xFF,0xFF}, 16, 0},
+  {0xEF, (const uint8_t []){0x08,0x08,0x08,0x40,0x3F,0x64}, 6, 0},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x13}, 5, 0},
+  {0xE8, (const uint8_t []){0x00,0x0E}, 2, 0},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x00}, 5, 0},
+  {0x11, (const uint8_t []){0x00}, 0, 120},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x13}, 5, 0},
+  {0xE8, (const uint8_t []){0x00,0x0C}, 2, 10},
+  {0xE8, (const uint8_t []){0x00,0x00}, 2, 0},
+  {0xFF, (const uint8_t []){0x77,0x01,0x00,0x00,0x00}, 5, 0},
+  {0x3A, (const uint8_t []){0x55}, 1, 0},
+  {0x36, (const uint8_t []){0x00}, 1, 0},
+  {0x35, (const uint8_t []){0x00}, 1, 0},
+  {0x29, (const uint8_t []){0x00}, 0, 20},
 };
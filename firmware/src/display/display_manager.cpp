@@ -19,6 +19,9 @@
 #define BYTES_PER_PIXEL 2  // RGB565
 #define BUFF_SIZE (LCD_H_RES * LCD_V_RES * BYTES_PER_PIXEL)
 
+// Button labels shown before the bridge sends its own
+static const char* const DEFAULT_BUTTON_LABELS[4] = {"1", "2", "3", "4"};
+
 // --- Static references for C callbacks ---
 static SemaphoreHandle_t s_flushSem = nullptr;
 static SemaphoreHandle_t s_lvglMux = nullptr;
@@ -216,8 +219,7 @@ void DisplayManager::initLVGL() {
     lv_display_set_user_data(_disp, _panel);
 
     // Software rotation: 90 degrees for landscape (820x320)
-    _rotBuf = (uint8_t*)heap_caps_malloc(BUFF_SIZE, MALLOC_CAP_SPIRAM);
-    s_rotBuf = _rotBuf;
+    s_rotBuf = (uint8_t*)heap_caps_malloc(BUFF_SIZE, MALLOC_CAP_SPIRAM);
     lv_display_set_rotation(_disp, LV_DISPLAY_ROTATION_90);
 
     // LVGL tick timer (2ms)
@@ -243,23 +245,24 @@ void DisplayManager::createUI() {
     lv_obj_set_style_bg_color(scr, lv_color_hex(0x10141a), 0);
 
     // Status bar (top 30px)
-    _statusBar = lv_obj_create(scr);
-    lv_obj_set_size(_statusBar, SCREEN_WIDTH, 30);
-    lv_obj_set_pos(_statusBar, 0, 0);
-    lv_obj_set_style_bg_color(_statusBar, lv_color_hex(0x1a2030), 0);
-    lv_obj_set_style_radius(_statusBar, 0, 0);
-    lv_obj_set_style_border_width(_statusBar, 0, 0);
-    lv_obj_set_style_pad_all(_statusBar, 0, 0);
-
-    _statusLabel = lv_label_create(_statusBar);
-    lv_label_set_text(_statusLabel, "Ready");
-    lv_obj_set_style_text_color(_statusLabel, lv_color_hex(0x00ff00), 0);
+    lv_obj_t* statusBar = lv_obj_create(scr);
+    lv_obj_set_size(statusBar, SCREEN_WIDTH, 30);
+    lv_obj_set_pos(statusBar, 0, 0);
+    lv_obj_set_style_bg_color(statusBar, lv_color_hex(0x1a2030), 0);
+    lv_obj_set_style_radius(statusBar, 0, 0);
+    lv_obj_set_style_border_width(statusBar, 0, 0);
+    lv_obj_set_style_pad_all(statusBar, 0, 0);
+
+    _statusLabel = lv_label_create(statusBar);
+    strlcpy(_statusText, "Ready", sizeof(_statusText));
+    lv_label_set_text_static(_statusLabel, _statusText);
+    lv_obj_set_style_text_color(_statusLabel, lv_color_hex(_statusColor), 0);
     lv_obj_set_style_text_font(_statusLabel, FONT_STATUS, 0);
     lv_obj_align(_statusLabel, LV_ALIGN_LEFT_MID, 8, 0);
 
     // Notification text area (middle)
     _notifLabel = lv_label_create(scr);
-    lv_label_set_text(_notifLabel, "");
+    lv_label_set_text_static(_notifLabel, _notifText);
     lv_label_set_long_mode(_notifLabel, LV_LABEL_LONG_WRAP);
     lv_obj_set_width(_notifLabel, SCREEN_WIDTH - 16);
     lv_obj_set_pos(_notifLabel, 8, 38);
@@ -269,15 +272,15 @@ void DisplayManager::createUI() {
     // Button bar (bottom 70px)
     int btnWidth = SCREEN_WIDTH / 4;
     for (int i = 0; i < 4; i++) {
-        _btnObjs[i] = lv_button_create(scr);
-        lv_obj_set_size(_btnObjs[i], btnWidth - 8, 62);
-        lv_obj_set_pos(_btnObjs[i], i * btnWidth + 4, SCREEN_HEIGHT - 66);
-        lv_obj_set_style_bg_color(_btnObjs[i], lv_color_hex(0x2a3040), 0);
-        lv_obj_set_style_radius(_btnObjs[i], 6, 0);
-
-        _btnLabels[i] = lv_label_create(_btnObjs[i]);
-        char label[2] = {(char)('1' + i), '\0'};
-        lv_label_set_text(_btnLabels[i], label);
+        lv_obj_t* btn = lv_button_create(scr);
+        lv_obj_set_size(btn, btnWidth - 8, 62);
+        lv_obj_set_pos(btn, i * btnWidth + 4, SCREEN_HEIGHT - 66);
+        lv_obj_set_style_bg_color(btn, lv_color_hex(0x2a3040), 0);
+        lv_obj_set_style_radius(btn, 6, 0);
+
+        _btnLabels[i] = lv_label_create(btn);
+        strlcpy(_btnText[i], DEFAULT_BUTTON_LABELS[i], sizeof(_btnText[i]));
+        lv_label_set_text_static(_btnLabels[i], _btnText[i]);
         lv_obj_set_style_text_color(_btnLabels[i], lv_color_hex(0xffffff), 0);
         lv_obj_set_style_text_font(_btnLabels[i], FONT_BUTTON, 0);
         lv_obj_center(_btnLabels[i]);
@@ -294,9 +297,8 @@ bool DisplayManager::begin() {
     }
 
     _lvglMux = xSemaphoreCreateMutex();
-    _flushSem = xSemaphoreCreateBinary();
     s_lvglMux = _lvglMux;
-    s_flushSem = _flushSem;
+    s_flushSem = xSemaphoreCreateBinary();
 
     initBacklight();
     initPanel();
@@ -322,15 +324,14 @@ void DisplayManager::unlock() {
 
 void DisplayManager::setStatusText(const char* text, uint32_t color) {
     if (lock()) {
-        lv_label_set_text(_statusLabel, text);
-        lv_obj_set_style_text_color(_statusLabel, lv_color_hex(color), 0);
+        applyStatusText(text, color);
         unlock();
     }
 }
 
 void DisplayManager::setNotificationText(const char* text) {
     if (lock()) {
-        lv_label_set_text(_notifLabel, text);
+        applyNotificationText(text);
         unlock();
     }
 }
@@ -339,31 +340,53 @@ void DisplayManager::setButtonLabels(const char* btn1, const char* btn2,
                                      const char* btn3, const char* btn4) {
     const char* labels[] = {btn1, btn2, btn3, btn4};
     if (lock()) {
-        for (int i = 0; i < 4; i++) {
-            if (labels[i]) {
-                lv_label_set_text(_btnLabels[i], labels[i]);
-            }
-        }
+        applyButtonLabels(labels);
+        unlock();
+    }
+}
+
+void DisplayManager::showIdleScreen(const char* status) {
+    // Single lock for all three updates so the LVGL task renders one
+    // composed frame instead of up to three intermediate ones
+    if (lock()) {
+        applyStatusText(status, 0x00ff00);
+        applyNotificationText("");
+        applyButtonLabels(DEFAULT_BUTTON_LABELS);
         unlock();
     }
 }
 
-void DisplayManager::showIdleScreen() {
-    setStatusText("Waiting for connection...");
-    setNotificationText("");
-    setButtonLabels("1", "2", "3", "4");
+// --- Unlocked setters (caller holds the LVGL mutex) ---
+
+// Labels display fixed buffers owned by DisplayManager (lv_label_set_text_static),
+// so updates copy into preallocated storage instead of reallocating LVGL heap
+// text each time. Unchanged text skips the re-layout and invalidation entirely.
+static void setLabelText(lv_obj_t* label, char* buf, size_t size, const char* text) {
+    // buf holds text truncated to size - 1 chars; compare that prefix so
+    // over-long text still counts as unchanged on repeat
+    if (strncmp(buf, text, size - 1) == 0) return;
+    strlcpy(buf, text, size);
+    lv_label_set_text_static(label, buf);
 }
 
-void DisplayManager::showNotification(const char* text, const char* category) {
-    if (category && category[0]) {
-        char statusBuf[128];
-        snprintf(statusBuf, sizeof(statusBuf), "[%s]", category);
-        setStatusText(statusBuf);
+void DisplayManager::applyStatusText(const char* text, uint32_t color) {
+    setLabelText(_statusLabel, _statusText, sizeof(_statusText), text);
+    // Setting a local style refreshes the object's styles and invalidates it,
+    // so only do it when the color actually changes
+    if (color != _statusColor) {
+        lv_obj_set_style_text_color(_statusLabel, lv_color_hex(color), 0);
+        _statusColor = color;
     }
-    setNotificationText(text);
 }
 
-void DisplayManager::update() {
-    // LVGL handles rendering automatically via its task
-    // No manual update needed
+void DisplayManager::applyNotificationText(const char* text) {
+    setLabelText(_notifLabel, _notifText, sizeof(_notifText), text);
+}
+
+void DisplayManager::applyButtonLabels(const char* const labels[4]) {
+    for (int i = 0; i < 4; i++) {
+        if (labels[i]) {
+            setLabelText(_btnLabels[i], _btnText[i], sizeof(_btnText[i]), labels[i]);
+        }
+    }
 }
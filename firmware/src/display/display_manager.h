@@ -13,10 +13,8 @@ public:
     void setNotificationText(const char* text);
     void setButtonLabels(const char* btn1, const char* btn2,
                          const char* btn3, const char* btn4);
-    void showIdleScreen();
-    void showNotification(const char* text, const char* category);
+    void showIdleScreen(const char* status = "Waiting for connection...");
     void setBrightness(uint8_t level);
-    void update();
 
     // Must be called from any thread before touching LVGL objects
     bool lock(int timeout_ms = -1);
@@ -27,17 +25,22 @@ private:
     void initLVGL();
     void initBacklight();
     void createUI();
+    void applyStatusText(const char* text, uint32_t color);
+    void applyNotificationText(const char* text);
+    void applyButtonLabels(const char* const labels[4]);
 
     esp_lcd_panel_handle_t _panel = nullptr;
     lv_display_t* _disp = nullptr;
     SemaphoreHandle_t _lvglMux = nullptr;
-    SemaphoreHandle_t _flushSem = nullptr;
-    uint8_t* _rotBuf = nullptr;
 
-    // LVGL UI objects
-    lv_obj_t* _statusBar = nullptr;
+    // LVGL UI objects (only those updated after createUI)
     lv_obj_t* _statusLabel = nullptr;
     lv_obj_t* _notifLabel = nullptr;
-    lv_obj_t* _btnObjs[4] = {};
     lv_obj_t* _btnLabels[4] = {};
+
+    // Label text storage (labels use lv_label_set_text_static)
+    char _statusText[128] = {};
+    uint32_t _statusColor = 0x00ff00;
+    char _notifText[MAX_MSG_LEN] = {};
+    char _btnText[4][32] = {};
 };
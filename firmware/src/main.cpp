@@ -12,14 +12,21 @@ static DisplayManager display;
 static SeesawManager seesaw;
 static SerialComms comms;
 
-// Debug print helper — suppressed when bridge is connected
+// Debug print helper — compiled out unless CAMELPAD_DEBUG, and suppressed
+// at runtime when bridge is connected
+#if CAMELPAD_DEBUG
 #define DBG(fmt, ...) do { if (!comms.bridgeConnected()) Serial.printf(fmt "\n", ##__VA_ARGS__); } while(0)
+#else
+#define DBG(fmt, ...) do { } while(0)
+#endif
 
 // --- Callbacks ---
 
 static void onButtonChange(uint8_t buttonId, bool pressed) {
     DBG("[btn] id=%d pressed=%d", buttonId, pressed);
-    comms.sendButtonEvent(buttonId, pressed);
+    if (!comms.sendButtonEvent(buttonId, pressed)) {
+        DBG("[btn] send failed id=%d", buttonId);
+    }
 
     // Visual feedback via NeoPixels
     if (pressed) {
@@ -30,24 +37,13 @@ static void onButtonChange(uint8_t buttonId, bool pressed) {
     seesaw.showPixels();
 }
 
+// Text payloads arrive NUL-terminated in the comms receive buffer
 static void onDisplayText(const char* text, uint16_t len) {
-    char buf[512];
-    uint16_t copyLen = len < sizeof(buf) - 1 ? len : sizeof(buf) - 1;
-    memcpy(buf, text, copyLen);
-    buf[copyLen] = '\0';
-
-    display.setNotificationText(buf);
-    display.update();
+    display.setNotificationText(text);
 }
 
 static void onStatusText(const char* text, uint16_t len) {
-    char buf[128];
-    uint16_t copyLen = len < sizeof(buf) - 1 ? len : sizeof(buf) - 1;
-    memcpy(buf, text, copyLen);
-    buf[copyLen] = '\0';
-
-    display.setStatusText(buf);
-    display.update();
+    display.setStatusText(text);
 }
 
 static void onSetLeds(const uint8_t* data, uint16_t len) {
@@ -63,19 +59,14 @@ static void onSetLeds(const uint8_t* data, uint16_t len) {
 
 static void onBridgeDisconnected() {
     display.setStatusText("DISCONNECTED", 0xff0000);
-    display.update();
 }
 
 static void onClearDisplay() {
-    display.setStatusText("Ready");
-    display.setNotificationText("");
-    display.setButtonLabels("1", "2", "3", "4");
-    display.update();
+    display.showIdleScreen("Ready");
 }
 
 static void onSetButtonLabels(const char* labels[4]) {
     display.setButtonLabels(labels[0], labels[1], labels[2], labels[3]);
-    display.update();
 }
 
 void setup() {
@@ -88,14 +79,12 @@ void setup() {
     Serial.println("[1/3] Initializing display...");
     display.begin();
     display.setStatusText("Booting...");
-    display.update();
     Serial.println("[1/3] Display OK");
 
     Serial.println("[2/3] Initializing Seesaw...");
     if (!seesaw.begin()) {
         Serial.println("[2/3] Seesaw init FAILED!");
         display.setStatusText("Seesaw init FAILED");
-        display.update();
     } else {
         Serial.println("[2/3] Seesaw OK");
         for (int i = 0; i < SEESAW_NEOPIXEL_COUNT; i++) {
@@ -121,21 +110,36 @@ void setup() {
     seesaw.showPixels();
 
     display.setStatusText("Ready - Waiting for connection...");
-    display.update();
     Serial.println("=== Setup Complete ===");
 }
 
+#if CAMELPAD_DEBUG
 static uint32_t lastHeartbeat = 0;
+#endif
 
 void loop() {
+    static TickType_t lastWake = xTaskGetTickCount();
+
     comms.poll();
     seesaw.poll();
 
-    // Periodic heartbeat — suppressed when bridge is connected
+#if CAMELPAD_DEBUG
+    // Periodic debug heartbeat — suppressed when bridge is connected
     if (millis() - lastHeartbeat > 5000) {
         lastHeartbeat = millis();
         DBG("[heartbeat] uptime=%lus", millis() / 1000);
     }
-
-    delay(10);
+#endif
+
+    // Sleep for the remainder of the period so polling runs at a fixed rate
+    // regardless of how long this iteration's I2C/serial work took. If this
+    // iteration overran (e.g. blocked on the LVGL mutex during a render),
+    // resync instead of letting vTaskDelayUntil run catch-up iterations
+    // back-to-back — those would bunch the debounce reads together and
+    // never yield to lower-priority tasks.
+    const TickType_t period = pdMS_TO_TICKS(LOOP_PERIOD_MS);
+    if (xTaskGetTickCount() - lastWake >= period) {
+        lastWake = xTaskGetTickCount();
+    }
+    vTaskDelayUntil(&lastWake, period);
 }
@@ -1,7 +1,8 @@
 #include "seesaw_manager.h"
 #include <Wire.h>
+#include <cstring>
 
-constexpr uint8_t SeesawManager::BUTTON_PINS[4];
+constexpr uint8_t SeesawManager::BUTTON_PINS[];
 
 bool SeesawManager::begin() {
     Wire.begin(PIN_I2C_SDA, PIN_I2C_SCL);
@@ -16,41 +17,55 @@ bool SeesawManager::begin() {
 
     // All pins use INPUT_PULLUP. Auto-detect idle polarity:
     // if a pin reads LOW at boot (tied to GND), it's active-high.
-    for (int i = 0; i < 4; i++) {
+    for (int i = 0; i < SEESAW_BUTTON_COUNT; i++) {
         _pixels.pinMode(BUTTON_PINS[i], INPUT_PULLUP);
     }
     delay(10);  // Let pullups settle
-    for (int i = 0; i < 4; i++) {
+    _activeLowMask = 0;
+    for (int i = 0; i < SEESAW_BUTTON_COUNT; i++) {
         bool idle = _pixels.digitalRead(BUTTON_PINS[i]);
-        _activeLow[i] = (idle == 1);  // HIGH at idle = active-low button
-        _lastButtonState[i] = false;
-        _reportedState[i] = false;
+        if (idle) _activeLowMask |= 1 << i;  // HIGH at idle = active-low button
     }
+    _lastButtonMask = 0;
+    _reportedMask = 0;
 
     return true;
 }
 
 void SeesawManager::poll() {
     uint32_t now = millis();
-    for (int i = 0; i < 4; i++) {
+
+    // Read all button pins in one I2C transaction instead of one per button
+    uint32_t pins = _pixels.digitalReadBulk(BUTTON_MASK);
+
+    uint8_t raw = 0;
+    for (int i = 0; i < SEESAW_BUTTON_COUNT; i++) {
+        raw |= ((pins >> BUTTON_PINS[i]) & 1) << i;
+    }
+    uint8_t pressedMask = raw ^ _activeLowMask;
+
+    // Nothing changed and nothing pending — skip the per-button bookkeeping
+    if (pressedMask == _lastButtonMask && pressedMask == _reportedMask) return;
+
+    for (int i = 0; i < SEESAW_BUTTON_COUNT; i++) {
         // Skip if within debounce window
         if (now - _lastChangeTime[i] < DEBOUNCE_MS) continue;
 
-        bool raw = _pixels.digitalRead(BUTTON_PINS[i]);
-        bool pressed = _activeLow[i] ? !raw : raw;
+        uint8_t bit = 1 << i;
+        bool pressed = pressedMask & bit;
 
-        if (pressed == _lastButtonState[i]) {
-            // Same as last raw read — count consecutive matches
-            if (_stableCount[i] < 255) _stableCount[i]++;
-        } else {
+        if ((pressedMask ^ _lastButtonMask) & bit) {
             // Raw state changed — reset counter
-            _lastButtonState[i] = pressed;
+            _lastButtonMask ^= bit;
             _stableCount[i] = 1;
+        } else {
+            // Same as last raw read — count consecutive matches
+            if (_stableCount[i] < 255) _stableCount[i]++;
         }
 
         // Only report when we have enough consistent reads AND it differs from reported state
-        if (_stableCount[i] >= DEBOUNCE_READS && pressed != _reportedState[i]) {
-            _reportedState[i] = pressed;
+        if (_stableCount[i] >= DEBOUNCE_READS && ((pressedMask ^ _reportedMask) & bit)) {
+            _reportedMask ^= bit;
             _lastChangeTime[i] = now;
             if (_callback) {
                 _callback(i, pressed);
@@ -60,23 +75,28 @@ void SeesawManager::poll() {
 }
 
 bool SeesawManager::isButtonPressed(uint8_t btnIndex) {
-    if (btnIndex >= 4) return false;
-    return _lastButtonState[btnIndex];
+    if (btnIndex >= SEESAW_BUTTON_COUNT) return false;
+    return (_lastButtonMask >> btnIndex) & 1;
 }
 
 
 void SeesawManager::setPixelColor(uint8_t pixel, uint32_t color) {
-    if (pixel < SEESAW_NEOPIXEL_COUNT) {
+    if (pixel < SEESAW_NEOPIXEL_COUNT && _pixelColors[pixel] != color) {
         _pixels.setPixelColor(pixel, color);
+        _pixelColors[pixel] = color;
+        _pixelsDirty = true;
     }
 }
 
 void SeesawManager::clearPixels() {
-    for (int i = 0; i < SEESAW_NEOPIXEL_COUNT; i++) {
-        _pixels.setPixelColor(i, 0);
-    }
+    // Zeroes the whole pixel buffer in one I2C write rather than one per pixel
+    _pixels.clear();
+    memset(_pixelColors, 0, sizeof(_pixelColors));
+    _pixelsDirty = true;
 }
 
 void SeesawManager::showPixels() {
+    if (!_pixelsDirty) return;
     _pixels.show();
+    _pixelsDirty = false;
 }
@@ -4,6 +4,12 @@
 #include <seesaw_neopixel.h>
 #include "../config.h"
 
+// OR of (1 << pin) over a pin array, for seesaw digitalReadBulk masks
+template <size_t N>
+constexpr uint32_t seesawPinMask(const uint8_t (&pins)[N], size_t i = 0) {
+    return i < N ? (1UL << pins[i]) | seesawPinMask(pins, i + 1) : 0;
+}
+
 class SeesawManager {
 public:
     using ButtonCallback = void (*)(uint8_t buttonId, bool pressed);
@@ -25,14 +31,25 @@ private:
     seesaw_NeoPixel _pixels{SEESAW_NEOPIXEL_COUNT, SEESAW_NEOPIX_PIN,
                             NEO_GRB + NEO_KHZ800};
 
-    static constexpr uint8_t BUTTON_PINS[4] = {
+    static constexpr uint8_t BUTTON_PINS[] = {
         SEESAW_BTN_1, SEESAW_BTN_2, SEESAW_BTN_3, SEESAW_BTN_4
     };
-    // true = active-low (pullup, press→LOW), false = active-high (pulldown, press→HIGH)
-    bool _activeLow[4] = {};
-    bool _lastButtonState[4] = {};
-    bool _reportedState[4] = {};      // State reported to callback
-    uint8_t _stableCount[4] = {};     // Consecutive reads matching _lastButtonState
-    uint32_t _lastChangeTime[4] = {};
+    static_assert(sizeof(BUTTON_PINS) == SEESAW_BUTTON_COUNT,
+                  "BUTTON_PINS must list exactly SEESAW_BUTTON_COUNT pins");
+    static constexpr uint32_t BUTTON_MASK = seesawPinMask(BUTTON_PINS);
+
+    // Button state bitmasks, bit i = button i
+    static_assert(SEESAW_BUTTON_COUNT <= 8, "button state bitmasks are uint8_t");
+    // Set in _activeLowMask = active-low (pullup, press→LOW), clear = active-high (pulldown, press→HIGH)
+    uint8_t _activeLowMask = 0;
+    uint8_t _lastButtonMask = 0;      // Last raw (polarity-corrected) read
+    uint8_t _reportedMask = 0;        // State reported to callback
+    uint8_t _stableCount[SEESAW_BUTTON_COUNT] = {};  // Consecutive reads matching _lastButtonMask
+    uint32_t _lastChangeTime[SEESAW_BUTTON_COUNT] = {};
+
+    // Last color written per pixel — each setPixelColor/show is an I2C transfer,
+    // so unchanged colors and clean buffers are skipped
+    uint32_t _pixelColors[SEESAW_NEOPIXEL_COUNT] = {};
+    bool _pixelsDirty = false;
     ButtonCallback _callback = nullptr;
 };
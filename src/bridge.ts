@@ -1,9 +1,11 @@
-import { SerialDevice } from './serial/device.js';
+import { SerialDevice, BUTTON_IDS } from './serial/device.js';
+import type { ButtonEvent } from './serial/device.js';
 import { GestureDetector } from './gesture/detector.js';
 import { ConfigWatcher } from './config/watcher.js';
 import { NotificationServer } from './websocket/server.js';
 import { validateConfig } from './config/loader.js';
-import type { NotificationMessage, LogEntry } from './types.js';
+import type { GestureConfig } from './gesture/types.js';
+import type { Config, NotificationMessage, LogEntry } from './types.js';
 
 export interface BridgeStatus {
   connected: boolean;
@@ -27,6 +29,17 @@ function remapButtonIndex(i: number, h: 'left' | 'right'): number {
   return h === 'right' ? 3 - i : i;
 }
 
+function gestureConfigFor(config: Config): GestureConfig {
+  return {
+    longPressMs: config.gestures.longPressMs,
+    doublePressMs: config.gestures.doublePressMs,
+  };
+}
+
+function logPreview(text: string): string {
+  return text.length > 60 ? text.slice(0, 60) + '…' : text;
+}
+
 function extractLabelsForDisplay(config: any, handedness: 'left' | 'right'): string[] {
   // Extract labels for each logical key (key0-key3)
   const keyLabels: string[] = [];
@@ -72,10 +85,7 @@ export async function startBridge(configPath: string): Promise<BridgeHandle> {
     productId: config.device.productId,
   });
 
-  const gestureDetector = new GestureDetector({
-    longPressMs: config.gestures.longPressMs,
-    doublePressMs: config.gestures.doublePressMs,
-  });
+  const gestureDetector = new GestureDetector(gestureConfigFor(config));
 
   const notificationServer = new NotificationServer(config);
 
@@ -104,10 +114,10 @@ export async function startBridge(configPath: string): Promise<BridgeHandle> {
   }
 
   // Serial button events → Gesture detector (with handedness remapping)
-  serialDevice.on('button', ({ buttonId, pressed }) => {
+  serialDevice.on('button', ({ buttonId, index, pressed }: ButtonEvent) => {
     pushLog('in', 'button', `${buttonId} ${pressed ? 'pressed' : 'released'}`);
-    const num = parseInt(buttonId.replace('key', ''));
-    const remapped = `key${remapButtonIndex(num, handedness)}`;
+    const logical = remapButtonIndex(index, handedness);
+    const remapped = BUTTON_IDS[logical] ?? `key${logical}`;
     gestureDetector.handleButton(remapped, pressed);
   });
 
@@ -146,8 +156,9 @@ export async function startBridge(configPath: string): Promise<BridgeHandle> {
 
   // Notification events → Serial display
   notificationServer.on('notification', (message: NotificationMessage) => {
-    pushLog('in', 'notification', message.text.length > 60 ? message.text.slice(0, 60) + '…' : message.text);
-    pushLog('out', 'display', message.text.length > 60 ? message.text.slice(0, 60) + '…' : message.text);
+    const preview = logPreview(message.text);
+    pushLog('in', 'notification', preview);
+    pushLog('out', 'display', preview);
     console.log(`Notification: ${message.text}`);
     serialDevice.sendText(message.text);
   });
@@ -164,10 +175,7 @@ export async function startBridge(configPath: string): Promise<BridgeHandle> {
     pushLog('sys', 'config', 'Configuration reloaded');
     console.log('Applying new configuration...');
     handedness = newConfig.handedness;
-    gestureDetector.updateConfig({
-      longPressMs: newConfig.gestures.longPressMs,
-      doublePressMs: newConfig.gestures.doublePressMs,
-    });
+    gestureDetector.updateConfig(gestureConfigFor(newConfig));
     notificationServer.updateConfig(newConfig);
 
     // Update button labels if connected
@@ -204,11 +212,11 @@ export async function startBridge(configPath: string): Promise<BridgeHandle> {
       return { entries, cursor: logSeq };
     },
     sendText(text: string): boolean {
-      pushLog('out', 'display-text', text.length > 60 ? text.slice(0, 60) + '…' : text);
+      pushLog('out', 'display-text', logPreview(text));
       return serialDevice.sendText(text);
     },
     sendStatus(text: string): boolean {
-      pushLog('out', 'status-text', text.length > 60 ? text.slice(0, 60) + '…' : text);
+      pushLog('out', 'status-text', logPreview(text));
       return serialDevice.sendStatus(text);
     },
     clearDisplay(): boolean {
@@ -1,9 +1,5 @@
-export type GestureType = 'press' | 'doublePress' | 'longPress';
-
-export interface GestureEvent {
-  buttonId: string;
-  gesture: GestureType;
-}
+// GestureType and GestureEvent are shared with the WebSocket server; defined once in ../types.ts
+export type { GestureType, GestureEvent } from '../types.js';
 
 export interface GestureConfig {
   longPressMs: number;
@@ -16,8 +16,16 @@ export interface SerialDeviceConfig {
   productId?: number;
 }
 
+// Pre-built button IDs so button frames don't format a new string per event
+export const BUTTON_IDS: readonly string[] = ['key0', 'key1', 'key2', 'key3'];
+
+// Payload-less frames never change, so build them once and share them
+const CLEAR_FRAME = buildFrame(MSG_CLEAR);
+const PING_FRAME = buildFrame(MSG_PING);
+
 export interface ButtonEvent {
   buttonId: string;
+  index: number;
   pressed: boolean;
 }
 
@@ -105,16 +113,26 @@ export class SerialDevice extends EventEmitter {
     this.pollTimer = setInterval(() => {
       if (this.fd === null) return;
 
+      let bytesRead: number;
       try {
-        const bytesRead = readSync(this.fd, buf, 0, buf.length, null);
-        if (bytesRead > 0) {
-          this.parser.parse(buf.subarray(0, bytesRead));
-        }
+        bytesRead = readSync(this.fd, buf, 0, buf.length, null);
       } catch (err: any) {
         // EAGAIN/EWOULDBLOCK is normal for non-blocking reads with no data
         if (err.code === 'EAGAIN' || err.code === 'EWOULDBLOCK') return;
         // EIO or other errors mean the device was disconnected
         this.handleError(err);
+        return;
+      }
+
+      if (bytesRead === 0) return;
+
+      // A parser or frame-handler failure is not a device disconnect: log it
+      // and drop the partial frame instead of reconnecting
+      try {
+        this.parser.parse(buf.subarray(0, bytesRead));
+      } catch (err: any) {
+        console.error('Error handling serial data:', err?.message ?? err);
+        this.parser.reset();
       }
     }, this.POLL_INTERVAL);
   }
@@ -137,8 +155,9 @@ export class SerialDevice extends EventEmitter {
   }
 
   private sleepMs(ms: number): void {
-    const start = Date.now();
-    while (Date.now() - start < ms) {
+    // Monotonic clock — a wall-clock step backwards would otherwise stall this loop
+    const start = performance.now();
+    while (performance.now() - start < ms) {
       // Busy-wait for minimal latency
     }
   }
@@ -147,9 +166,10 @@ export class SerialDevice extends EventEmitter {
     switch (frame.msgType) {
       case MSG_BUTTON: {
         if (frame.payload.length >= 2) {
-          const buttonId = `key${frame.payload[0]}`;
+          const index = frame.payload[0];
+          const buttonId = BUTTON_IDS[index] ?? `key${index}`;
           const pressed = frame.payload[1] === 1;
-          this.emit('button', { buttonId, pressed } as ButtonEvent);
+          this.emit('button', { buttonId, index, pressed } as ButtonEvent);
         }
         break;
       }
@@ -174,13 +194,19 @@ export class SerialDevice extends EventEmitter {
   }
 
   sendLabels(labels: string[]): boolean {
-    const parts: Buffer[] = [];
+    // Encode [len, label...] pairs straight into one buffer
+    let size = 0;
+    for (const label of labels) {
+      size += 1 + Buffer.byteLength(label, 'utf8');
+    }
+    const payload = Buffer.allocUnsafe(size);
+    let pos = 0;
     for (const label of labels) {
-      const encoded = Buffer.from(label, 'utf8');
-      const lenBuf = Buffer.from([encoded.length]);
-      parts.push(lenBuf, encoded);
+      const len = payload.write(label, pos + 1, 'utf8');
+      payload[pos] = len;
+      pos += 1 + len;
     }
-    return this.sendMessage(MSG_SET_LABELS, Buffer.concat(parts));
+    return this.sendMessage(MSG_SET_LABELS, payload);
   }
 
   sendLeds(leds: Array<{ index: number; r: number; g: number; b: number }>): boolean {
@@ -196,21 +222,24 @@ export class SerialDevice extends EventEmitter {
   }
 
   clearDisplay(): boolean {
-    return this.sendMessage(MSG_CLEAR);
+    return this.writeFrame(CLEAR_FRAME);
   }
 
   sendPing(): boolean {
-    return this.sendMessage(MSG_PING);
+    return this.writeFrame(PING_FRAME);
   }
 
   private sendMessage(msgType: number, payload?: Buffer): boolean {
+    return this.writeFrame(buildFrame(msgType, payload));
+  }
+
+  private writeFrame(frame: Buffer): boolean {
     if (this.fd === null) {
       console.error('Failed to send: fd is null');
       return false;
     }
 
     try {
-      const frame = buildFrame(msgType, payload);
       let written = 0;
       let retries = 0;
 
@@ -31,12 +31,14 @@ export async function listPorts(): Promise<PortInfo[]> {
  * Returns the device path, or undefined if not found.
  */
 export async function findPort(vendorId: number, productId: number): Promise<string | undefined> {
-  const ports = await listPorts();
   const vid = vendorId.toString(16).toLowerCase();
   const pid = productId.toString(16).toLowerCase();
 
-  const match = ports.find(p =>
-    p.vendorId === vid && p.productId === pid
+  // IDs only come from ioreg, so match its entries directly (stopping at the
+  // first hit) rather than listing /dev and joining every port against them
+  const usbInfo = process.platform === 'darwin' ? getAcmDeviceInfo() : [];
+  const match = usbInfo.find(u =>
+    u.vendorId === vid && u.productId === pid
   );
 
   return match?.path;
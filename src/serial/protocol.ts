@@ -3,6 +3,7 @@ import { FRAME_START_BYTE, MAX_MSG_LEN } from '../types.js';
 
 export interface ParsedFrame {
   msgType: number;
+  /** View into the parser's body buffer — only valid inside the 'frame' handler. */
   payload: Buffer;
 }
 
@@ -24,7 +25,8 @@ function xorChecksum(data: Buffer, offset: number, length: number): number {
 export function buildFrame(msgType: number, payload?: Buffer): Buffer {
   const payloadLen = payload ? payload.length : 0;
   const bodyLen = 1 + payloadLen; // msgType + payload
-  const frame = Buffer.alloc(5 + payloadLen);
+  // Every byte is written below, so skip the zero-fill
+  const frame = Buffer.allocUnsafe(5 + payloadLen);
 
   frame[0] = FRAME_START_BYTE;
   frame[1] = (bodyLen >> 8) & 0xFF;
@@ -55,6 +57,7 @@ export class FrameParser extends EventEmitter {
   private bodyLen = 0;
   private bodyBuf = Buffer.alloc(MAX_MSG_LEN);
   private bodyPos = 0;
+  private bodyChecksum = 0; // Running XOR of body bytes received so far
 
   /** Feed a chunk of incoming serial data. */
   parse(data: Buffer): void {
@@ -79,22 +82,23 @@ export class FrameParser extends EventEmitter {
             this.state = ParserState.WAIT_START;
           } else {
             this.bodyPos = 0;
+            this.bodyChecksum = 0;
             this.state = ParserState.READ_BODY;
           }
           break;
 
         case ParserState.READ_BODY:
           this.bodyBuf[this.bodyPos++] = byte;
+          this.bodyChecksum ^= byte; // Accumulate as bytes arrive — no second pass over the body
           if (this.bodyPos >= this.bodyLen) {
             this.state = ParserState.READ_CHECKSUM;
           }
           break;
 
         case ParserState.READ_CHECKSUM: {
-          const expected = xorChecksum(this.bodyBuf, 0, this.bodyLen);
-          if (byte === expected) {
+          if (byte === this.bodyChecksum) {
             const msgType = this.bodyBuf[0];
-            const payload = Buffer.from(this.bodyBuf.subarray(1, this.bodyLen));
+            const payload = this.bodyBuf.subarray(1, this.bodyLen);
             this.emit('frame', { msgType, payload } as ParsedFrame);
           }
           this.state = ParserState.WAIT_START;
@@ -108,5 +112,6 @@ export class FrameParser extends EventEmitter {
     this.state = ParserState.WAIT_START;
     this.bodyLen = 0;
     this.bodyPos = 0;
+    this.bodyChecksum = 0;
   }
 }